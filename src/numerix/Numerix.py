@@ -1,5 +1,7 @@
-import pandas as pd
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class Numerix:
     """
@@ -16,8 +18,13 @@ class Numerix:
     is_logging : bool
         If True, enables logging of runtime information into a pandas DataFrame.
     logs : pd.DataFrame
-        DataFrame storing log entries. Initialized empty and populated via
-        `add_logs` when logging is enabled.
+        DataFrame storing log entries. Built lazily from the columns collected
+        by `add_logs` and cached until the next entry is added. Assigning a
+        DataFrame (e.g. an empty one) replaces the collected entries.
+    _log_data : Dict[str, list]
+        Internal columnar buffer of log entries, one list per column.
+        Appending to a list is O(1), whereas growing a DataFrame row by row
+        reallocates it on every entry.
     _log_columns : list[str]
         Internal list defining the expected log schema (column names).
         Determined by the first log entry and enforced for all subsequent logs.
@@ -73,12 +80,58 @@ class Numerix:
         """
         self.is_verbose = is_verbose
         self.is_logging = is_logging
-        self.logs = pd.DataFrame()
+        self._log_data: Dict[str, list] = {}
         self._log_columns: list[str] = []
+        self._logs_cache: Optional["pd.DataFrame"] = None
+
+    @property
+    def logs(self) -> "pd.DataFrame":
+        """
+        Log entries collected so far as a pandas DataFrame.
+
+        The DataFrame is constructed on first access after new entries have
+        been added and reused on subsequent accesses. pandas is imported
+        here rather than at module level so that solvers which never read
+        their logs do not pay its import cost.
+
+        The returned DataFrame is a snapshot: in-place edits to it are
+        discarded by the next `add_logs`. To replace the log, assign a
+        DataFrame to `logs` instead.
+
+        Examples
+        --------
+        >>> nx = Numerix(is_logging=True)
+        >>> len(nx.logs)
+        0
+        >>> nx.add_logs({"iter": 1, "loss": 0.5})
+        >>> len(nx.logs)
+        1
+
+        Assigning an empty DataFrame resets the log and its schema:
+
+        >>> import pandas as pd
+        >>> nx.logs = pd.DataFrame()
+        >>> nx.add_logs({"step": 1})
+        >>> list(nx.logs.columns)
+        ['step']
+        """
+        if self._logs_cache is None:
+            import pandas as pd
+
+            self._logs_cache = pd.DataFrame(self._log_data)
+        return self._logs_cache
+
+    @logs.setter
+    def logs(self, logs: "pd.DataFrame"):
+        self._log_columns = list(logs.columns)
+        self._log_data = {
+            column: logs[column].tolist() for column in self._log_columns
+        }
+        self._logs_cache = None
 
     def add_logs(self, log: Dict[str, Any]):
         """
-        Add a log entry to the internal log DataFrame.
+        Append a log entry to the internal column buffer.
 
         The first call initializes the logging schema using the keys of
         the provided dictionary. All subsequent calls must provide
@@ -116,7 +169,7 @@ class Numerix:
 
         if not self._log_columns:
             self._log_columns = list(log.keys())
-            self.logs = pd.DataFrame(columns=self._log_columns)
+            self._log_data = {key: [] for key in self._log_columns}
         else:
             if list(log.keys()) != self._log_columns:
                 raise ValueError(
@@ -124,4 +177,6 @@ class Numerix:
                     "Ensure consistent log structure for every entry."
                 )
 
-        self.logs.loc[len(self.logs)] = log
+        for key, value in log.items():
+            self._log_data[key].append(value)
+        self._logs_cache = None
@@ -1 +1,38 @@
+import importlib
+from typing import Any
 
+# Subpackages and public classes are imported on first attribute access
+# (PEP 562), so ``import numerix`` stays cheap.
+_submodules = [
+    "integration",
+    "interpolation",
+    "linear",
+    "nonlinear",
+    "ode",
+    "optimization",
+    "roots",
+    "utils",
+]
+
+_submod_attrs = {
+    "Bisection": "numerix.roots.Bisection",
+    "RegulaFalsi": "numerix.roots.RegulaFalsi",
+    "Secant": "numerix.roots.Secant",
+}
+
+__all__ = _submodules + list(_submod_attrs)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name in _submod_attrs:
+        module = importlib.import_module(_submod_attrs[name])
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,27 @@
+from . import (
+    integration as integration,
+    interpolation as interpolation,
+    linear as linear,
+    nonlinear as nonlinear,
+    ode as ode,
+    optimization as optimization,
+    roots as roots,
+    utils as utils,
+)
+from .roots.Bisection import Bisection as Bisection
+from .roots.RegulaFalsi import RegulaFalsi as RegulaFalsi
+from .roots.Secant import Secant as Secant
+
+__all__ = [
+    "integration",
+    "interpolation",
+    "linear",
+    "nonlinear",
+    "ode",
+    "optimization",
+    "roots",
+    "utils",
+    "Bisection",
+    "RegulaFalsi",
+    "Secant",
+]
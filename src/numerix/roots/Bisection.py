@@ -1,10 +1,16 @@
 from typing import Callable
 from numerix.Numerix import Numerix
+from numerix.utils import is_jitted
 
 
 class Bisection(Numerix):
     """
     Bisection method for finding roots of a continuous single-variable function.
+
+    With ``start(jit=True)`` and a Numba ``@njit`` function, the loop runs
+    in compiled code. The loop is compiled again for every new function
+    object, so this pays off only when the same function is solved many
+    times. Logging forces the Python loop.
     """
 
     def __init__(
@@ -36,20 +42,32 @@ class Bisection(Numerix):
         self.lower = float(lower)
         self.upper = float(upper)
 
-    def start(self, tol: float = 1e-6, max_iter: int = 1000) -> float:
+    def start(
+        self, tol: float = 1e-6, max_iter: int = 1000, *, jit: bool = False
+    ) -> float:
         f = self.function
         a, b = self.lower, self.upper
         fa, fb = f(a), f(b)
 
-        if fa * fb >= 0:
+        if fa == 0 or fb == 0 or (fa < 0) == (fb < 0):
             raise ValueError("Function must have opposite signs at the bounds.")
 
+        if jit and not self.is_logging and is_jitted(f):
+            from numerix.roots._numba_kernels import bisection
+
+            c, converged = bisection(f, a, b, fa, tol, max_iter)
+            if converged:
+                return c
+            raise RuntimeError("Bisection method did not converge.")
+
+        log = self.add_logs if self.is_logging else None
+
         for i in range(1, max_iter + 1):
             c = (a + b) / 2
             fc = f(c)
 
-            if self.is_logging:
-                self.add_logs(
+            if log is not None:
+                log(
                     {
                         "iter": i,
                         "lower": a,
@@ -62,7 +80,7 @@ class Bisection(Numerix):
             if abs(fc) < tol or abs(b - a) / 2 < tol:
                 return c
 
-            if fa * fc < 0:
+            if (fa < 0) != (fc < 0):
                 b, fb = c, fc
             else:
                 a, fa = c, fc
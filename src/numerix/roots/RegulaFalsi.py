@@ -1,11 +1,29 @@
 from typing import Callable
 from numerix.Numerix import Numerix
+from numerix.utils import is_jitted
 
 
 class RegulaFalsi(Numerix):
     """
     Regula Falsi (False Position) method for finding roots of a
     continuous single-variable function.
+
+    Uses the Illinois modification to avoid the one-sided, linear
+    convergence of the plain method.
+
+    ``start(jit=True)`` runs the loop in compiled code for ``@njit``
+    functions; see `Bisection` for when that is worthwhile.
+
+    Examples
+    --------
+    A steep, convex function on which plain false position stalls with
+    one endpoint fixed converges quickly:
+
+    >>> rf = RegulaFalsi(lambda x: x**10 - 1, 0, 3, is_logging=True)
+    >>> round(rf.start(max_iter=100), 6)
+    1.0
+    >>> len(rf.logs)
+    24
     """
 
     def __init__(
@@ -40,23 +58,37 @@ class RegulaFalsi(Numerix):
         self.lower = float(lower)
         self.upper = float(upper)
 
-    def start(self, tol: float = 1e-6, max_iter: int = 1000) -> float:
+    def start(
+        self, tol: float = 1e-6, max_iter: int = 1000, *, jit: bool = False
+    ) -> float:
         f = self.function
         a, b = self.lower, self.upper
         fa, fb = f(a), f(b)
 
-        if fa * fb >= 0:
+        if fa == 0 or fb == 0 or (fa < 0) == (fb < 0):
             raise ValueError(
                 "Function must have opposite signs at the bounds."
             )
 
+        if jit and not self.is_logging and is_jitted(f):
+            from numerix.roots._numba_kernels import regula_falsi
+
+            c, converged = regula_falsi(f, a, b, fa, fb, tol, max_iter)
+            if converged:
+                return c
+            raise RuntimeError("Regula Falsi method did not converge.")
+
+        log = self.add_logs if self.is_logging else None
+        # -1 if b was replaced last, +1 if a was, 0 before the first step
+        side = 0
+
         for i in range(1, max_iter + 1):
             # Regula Falsi formula
             c = b - fb * (b - a) / (fb - fa)
             fc = f(c)
 
-            if self.is_logging:
-                self.add_logs(
+            if log is not None:
+                log(
                     {
                         "iter": i,
                         "lower": a,
@@ -69,9 +101,18 @@ class RegulaFalsi(Numerix):
             if abs(fc) < tol:
                 return c
 
-            if fa * fc < 0:
+            # Illinois modification: when the same endpoint is replaced
+            # twice in a row, halve the retained value at the other one so
+            # it cannot stay stuck and stall convergence.
+            if (fa < 0) != (fc < 0):
                 b, fb = c, fc
+                if side == -1:
+                    fa *= 0.5
+                side = -1
             else:
                 a, fa = c, fc
+                if side == +1:
+                    fb *= 0.5
+                side = +1
 
         raise RuntimeError("Regula Falsi method did not converge.")
@@ -42,6 +42,8 @@ class Secant(Numerix):
         x_prev, x_curr = self.x0, self.x1
         f_prev, f_curr = f(x_prev), f(x_curr)
 
+        log = self.add_logs if self.is_logging else None
+
         for i in range(1, max_iter + 1):
             if f_curr == f_prev:
                 raise ZeroDivisionError("Division by zero in secant update.")
@@ -49,8 +51,8 @@ class Secant(Numerix):
             x_next = x_curr - f_curr * (x_curr - x_prev) / (f_curr - f_prev)
             f_next = f(x_next)
 
-            if self.is_logging:
-                self.add_logs(
+            if log is not None:
+                log(
                     {
                         "iter": i,
                         "x_prev": x_prev,
@@ -0,0 +1,94 @@
+"""
+Numba-compiled loops for the bracketing root finders.
+
+These mirror the pure-Python ``start`` methods without logging. They are
+used only when ``start(jit=True)`` is called with a ``@njit`` function,
+so Numba is not required otherwise. Each kernel returns
+``(root, converged)`` and leaves raising to the caller.
+
+Both paths give the same result on the same function:
+
+>>> from numba import njit
+>>> from numerix.roots.Bisection import Bisection
+>>> from numerix.roots.RegulaFalsi import RegulaFalsi
+>>> f = njit(lambda x: x**10 - 1)
+>>> for method in (Bisection, RegulaFalsi):
+...     kernel = method(f, 0, 3).start(tol=1e-12, jit=True)
+...     python = method(f, 0, 3).start(tol=1e-12)
+...     print(method.__name__, kernel == python)
+Bisection True
+RegulaFalsi True
+
+Non-convergence raises the same error on both paths:
+
+>>> Bisection(f, 0, 3).start(max_iter=5, jit=True)
+Traceback (most recent call last):
+...
+RuntimeError: Bisection method did not converge.
+>>> Bisection(f, 0, 3).start(max_iter=5)
+Traceback (most recent call last):
+...
+RuntimeError: Bisection method did not converge.
+>>> RegulaFalsi(f, 0, 3).start(max_iter=5, jit=True)
+Traceback (most recent call last):
+...
+RuntimeError: Regula Falsi method did not converge.
+>>> RegulaFalsi(f, 0, 3).start(max_iter=5)
+Traceback (most recent call last):
+...
+RuntimeError: Regula Falsi method did not converge.
+
+Object-mode dispatchers cannot be called from a kernel and stay on the
+Python loop even with ``jit=True``:
+
+>>> from numba import jit
+>>> h = jit(forceobj=True)(lambda x: x - 1.0)
+>>> Bisection(h, 0, 2).start(jit=True)
+1.0
+>>> RegulaFalsi(h, 0, 3).start(jit=True)
+1.0
+"""
+from numba import njit
+
+
+@njit
+def bisection(f, a, b, fa, tol, max_iter):
+    c = a
+    for _ in range(max_iter):
+        c = (a + b) / 2
+        fc = f(c)
+
+        if abs(fc) < tol or abs(b - a) / 2 < tol:
+            return c, True
+
+        if (fa < 0) != (fc < 0):
+            b = c
+        else:
+            a, fa = c, fc
+
+    return c, False
+
+
+@njit
+def regula_falsi(f, a, b, fa, fb, tol, max_iter):
+    c = a
+    side = 0
+    for _ in range(max_iter):
+        c = b - fb * (b - a) / (fb - fa)
+        fc = f(c)
+
+        if abs(fc) < tol:
+            return c, True
+
+        if (fa < 0) != (fc < 0):
+            b, fb = c, fc
+            if side == -1:
+                fa *= 0.5
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == +1:
+                fb *= 0.5
+            side = +1
+
+    return c, False
@@ -0,0 +1,24 @@
+import sys
+from typing import Callable
+
+
+def is_jitted(function: Callable) -> bool:
+    """
+    Return True if `function` is a Numba ``@njit`` dispatcher.
+
+    Only nopython-mode dispatchers qualify, since only those can be called
+    from other compiled code. Object-mode dispatchers, e.g. from
+    ``jit(forceobj=True)``, are ``CPUDispatcher`` instances too, but
+    return False.
+
+    Numba is never imported here: if it is not already loaded, the caller
+    cannot have produced a dispatcher, so the check costs a dict lookup.
+    """
+    if "numba" not in sys.modules:
+        return False
+
+    from numba.core.registry import CPUDispatcher
+
+    return isinstance(function, CPUDispatcher) and bool(
+        function.targetoptions.get("nopython", False)
+    )